@@ -16,6 +16,7 @@
 """Conftest base on `ragger` conftest."""
 
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Generator, List, Union
 
@@ -127,10 +128,14 @@ def backend(app_path: Path,
             speculos_args: List[str]) -> Generator[MavrykBackend, None, None]:
     """Get `backend` for pytest."""
 
+    # Do not extend the session `speculos_args` in place: it would
+    # accumulate the arguments of every previous test
+    args = list(speculos_args)
+
     if display:
-        speculos_args += ["--display", "qt"]
+        args += ["--display", "qt"]
 
-    speculos_args += [
+    args += [
         "--api-port", f"{ port }",
         "--apdu-port", "0",
         "--seed", seed
@@ -138,7 +143,7 @@ def backend(app_path: Path,
 
     backend = SpeculosMavrykBackend(app_path,
                                    firmware,
-                                   args=speculos_args)
+                                   args=args)
 
     with backend as b:
         yield b
@@ -156,15 +161,19 @@ def mavryk_navigator(
         navigator = TouchNavigator(backend, firmware, golden_run)
     return MavrykNavigator(backend, firmware, navigator)
 
+TESTS_ROOT_DEPTH: int = len(Path(__file__).parts) - 1
+
+@lru_cache(maxsize=None)
+def file_snapshot_dir(test_file: str) -> Path:
+    """Get the snapshot location of a test file."""
+    test_file_path = Path(test_file)
+    # Get test directory from the root
+    return Path(*test_file_path.parts[TESTS_ROOT_DEPTH:-1]) / test_file_path.stem
+
 @pytest.fixture(scope="function")
 def snapshot_dir(request) -> Path :
     """Get the test snapshot location."""
-    test_file_path = Path(request.fspath)
-    file_name = test_file_path.stem
-    test_name = request.node.name
-    # Get test directory from the root
-    test_file_snapshot_dir = Path(*test_file_path.parts[len(Path(__file__).parts)-1:-1])
-    return test_file_snapshot_dir / file_name / test_name
+    return file_snapshot_dir(str(request.fspath)) / request.node.name
 
 def requires_device(device):
     """Wrapper to run the pytest test only with the provided device."""
@@ -173,30 +182,38 @@ def requires_device(device):
         reason=f"Test requires device to be { device }."
     )
 
-@pytest.fixture(autouse=True)
-def use_only_on_device(request, firmware: Firmware):
-    """Fixture to add tests on specific devices."""
-
-    def get_devices(device: str) -> List[str]:
-        if device == "nano":
-            return ["nanos", "nanosp", "nanox"]
-        if device == "touch":
-            return ["stax", "flex"]
-        return [device]
-
-    marker = request.node.get_closest_marker('use_on_device')
-    if marker:
-        current_device = firmware.device
-        requested_devices = marker.args[0]
-        devices: List[str] = []
-        if isinstance(requested_devices, str):
-            devices = get_devices(requested_devices)
-        else:
-            assert isinstance(requested_devices, list)
-            for device in requested_devices:
-                devices += get_devices(device)
-        if current_device not in devices:
-            pytest.skip(f'skipped on this device: "{current_device}"')
+def get_devices(device: str) -> List[str]:
+    """Get the devices corresponding to a `use_on_device` argument."""
+    if device == "nano":
+        return ["nanos", "nanosp", "nanox"]
+    if device == "touch":
+        return ["stax", "flex"]
+    return [device]
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect the tests marked to run on other devices.
+    Deselecting them at collection avoids setting up their fixtures."""
+    current_device = config.getoption("device")
+    selected = []
+    deselected = []
+    for item in items:
+        marker = item.get_closest_marker('use_on_device')
+        if marker:
+            requested_devices = marker.args[0]
+            devices: List[str] = []
+            if isinstance(requested_devices, str):
+                devices = get_devices(requested_devices)
+            else:
+                assert isinstance(requested_devices, list)
+                for device in requested_devices:
+                    devices += get_devices(device)
+            if current_device not in devices:
+                deselected.append(item)
+                continue
+        selected.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
 
 
 global_log_dir: Union[Path, None] = None
@@ -206,7 +223,7 @@ def pytest_configure(config):
     # Add marker
     config.addinivalue_line(
         "markers",
-        "use_on_device(devices): skip test if not on one of the specified devices",
+        "use_on_device(devices): deselect test if not on one of the specified devices",
     )
 
     # Setup log directory
@@ -20,40 +20,24 @@ from pathlib import Path
 
 import pytest
 
-from utils.account import Account, PublicKey, SigType
+from utils.account import Account, CURVE_ACCOUNTS, PublicKey
 from utils.backend import MavrykBackend, StatusCode
 from utils.navigator import MavrykNavigator
 
-accounts = [
-    Account("m/44'/1969'/0'/0'",
-            SigType.ED25519,
-            "edpktmumZ4vUDvg7VNFh5sGeSCnT7xYXhmzP2jwsiUUpUnQGoGfnja"),
-    Account("m/44'/1969'/0'/0'",
-            SigType.SECP256K1,
-            "sppk7b2Sh8Av9e1w7jzQ4qjZEgULFJETncKh7nWkgf29JpnJuKeXBqK"),
-    Account("m/44'/1969'/0'/0'",
-            SigType.SECP256R1,
-            "p2pk65YHEfEbWo7iMrz7JNjBvaYZNFBHU8vzCQEhw8rmbvAKuiGGiXS"),
-    Account("m/44'/1969'/0'/0'",
-            SigType.BIP32_ED25519,
-            "edpkuPErh5Lga9Ui39JPgfCHq2utQjGtKb3ig5NwM8yFnaetY1xD9f")
-]
-
-@pytest.mark.parametrize("account", accounts, ids=lambda account: f"{account.sig_type}")
+
+@pytest.mark.parametrize("account", CURVE_ACCOUNTS, ids=lambda account: f"{account.sig_type}")
 def test_get_pk(backend: MavrykBackend, account: Account):
     """Test that public keys get from the app are correct."""
 
-    expected_public_key = account.key.public_key()
-
     data = backend.get_public_key(account)
 
     public_key = PublicKey.from_bytes(data, account.sig_type)
 
-    assert public_key == expected_public_key.encode(), \
-        f"Expected public key {expected_public_key} but got {public_key}"
+    assert public_key == account.public_key, \
+        f"Expected public key {account.public_key} but got {public_key}"
 
 
-@pytest.mark.parametrize("account", accounts, ids=lambda account: f"{account.sig_type}")
+@pytest.mark.parametrize("account", CURVE_ACCOUNTS, ids=lambda account: f"{account.sig_type}")
 def test_provide_pk(
         backend: MavrykBackend,
         mavryk_navigator: MavrykNavigator,
@@ -62,15 +46,13 @@ def test_provide_pk(
 ):
     """Test that public keys get from the app are correct and correctly displayed."""
 
-    expected_public_key = account.key.public_key()
-
     with backend.prompt_public_key(account) as result:
         mavryk_navigator.accept_public_key(snap_path=snapshot_dir)
 
     public_key = PublicKey.from_bytes(result.value, account.sig_type)
 
-    assert public_key == expected_public_key.encode(), \
-        f"Expected public key {expected_public_key} but got {public_key}"
+    assert public_key == account.public_key, \
+        f"Expected public key {account.public_key} but got {public_key}"
 
 
 @pytest.mark.use_on_device("touch")
@@ -18,7 +18,7 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 import pytest
 
@@ -45,6 +45,8 @@ class Flow:
 
     """
 
+    __slots__ = ('name', 'fields')
+
     name: str
     fields: Dict[str, Any]
 
@@ -60,7 +62,7 @@ def parametrize_test_operation_flow(metafunc) -> None:
     args_ids = []
 
     if hasattr(metafunc.cls, 'flows'):
-        flows: List[Flow] = metafunc.cls.flows
+        flows: Sequence[Flow] = metafunc.cls.flows
         args_values = [[flow.fields] for flow in flows]
         args_ids = [f"flow-{flow.name}" for flow in flows]
 
@@ -80,7 +82,7 @@ class Field:
     text: str
     Title of the field displayed on the screen
 
-    cases: List[Case]
+    cases: Sequence[Case]
     Every cases to test
 
     """
@@ -99,6 +101,8 @@ class Field:
 
         """
 
+        __slots__ = ('value', 'name', 'fields')
+
         value: Any
         name: str
         fields: Dict[str, Any]
@@ -108,9 +112,11 @@ class Field:
             self.name = name
             self.fields = kwargs
 
+    __slots__ = ('name', 'text', 'cases')
+
     name: str
     text: str
-    cases: List[Case]
+    cases: Sequence[Case]
 
     def __init__(self, name, text, cases):
         self.name = name
@@ -121,26 +127,22 @@ class Field:
 def parametrize_test_operation_field(metafunc) -> None:
     """Parametrize `TestOperation.test_operation_field`."""
     args_names = ["field", "case_"]
-    args_values = []
-    args_ids = []
+    args_values: List[Tuple[Field, Field.Case]] = []
 
     if hasattr(metafunc.cls, 'fields'):
-        fields_args: List[Field] = metafunc.cls.fields
+        fields_args: Sequence[Field] = metafunc.cls.fields
         args_values = [
             (field, case_)
             for field in fields_args
             for case_ in field.cases
         ]
-        args_ids = [
-            f"{field.name}-{case_.name}"
-            for field in fields_args
-            for case_ in field.cases
-        ]
 
+    # Ids are computed for each argument then joined:
+    # <field.name>-<case_.name>
     metafunc.parametrize(
         args_names,
         args_values,
-        ids=args_ids
+        ids=lambda arg: arg.name
     )
 
 
@@ -229,8 +231,7 @@ class TestOperation(ABC):
 
         """
 
-        fields = case_.fields
-        fields[field.name] = case_.value
+        fields = {**case_.fields, field.name: case_.value}
         operation = self.op_class(**fields)
 
         mavryk_navigator.toggle_expert_mode()
@@ -17,7 +17,7 @@
 """Gathering of tests related to Blindsign."""
 
 from pathlib import Path
-from typing import List, Union
+from typing import List, Tuple, Union
 
 import pytest
 
@@ -27,6 +27,7 @@ from ragger.navigator import NavIns, NavInsID
 from utils.account import Account
 from utils.backend import MavrykBackend, StatusCode
 from utils.message import (
+    Micheline,
     MichelineExpr,
     Proposals,
     OperationGroup,
@@ -40,11 +41,16 @@ from utils.message import (
 from utils.navigator import MavrykNavigator
 
 
+SOURCE = 'mv1P8PBEjfFUb7EeHNBUa92vNHnJmvzUmhxb'
+
+
 ### Too long operation ###
 
+ROLLUP_MESSAGES = tuple(f"message{i}".encode() for i in range(30))
+
 BASIC_OPERATION = OperationGroup([
     Reveal(
-        source = 'mv1P8PBEjfFUb7EeHNBUa92vNHnJmvzUmhxb',
+        source = SOURCE,
         fee = 1000000,
         counter = 11,
         gas_limit = 1,
@@ -52,7 +58,7 @@ BASIC_OPERATION = OperationGroup([
         public_key = 'p2pk65YHEfEbWo7iMrz7JNjBvaYZNFBHU8vzCQEhw8rmbvAKuiGGiXS'
     ),
     Transaction(
-        source = 'mv1P8PBEjfFUb7EeHNBUa92vNHnJmvzUmhxb',
+        source = SOURCE,
         fee = 2000000,
         counter = 12,
         gas_limit = 1,
@@ -63,7 +69,7 @@ BASIC_OPERATION = OperationGroup([
         parameter = {'prim': 'Pair', 'args': [ {'int': 5}, {'prim': 'True'} ]}
     ),
     Delegation(
-        source = 'mv1P8PBEjfFUb7EeHNBUa92vNHnJmvzUmhxb',
+        source = SOURCE,
         fee = 3000000,
         counter = 13,
         gas_limit = 1,
@@ -71,36 +77,15 @@ BASIC_OPERATION = OperationGroup([
         delegate = 'mv2WfoqcNkcNmzWPndNxXqSe6r7vUY5jXt1w'
     ),
     ScRollupAddMessage(
-        source = 'mv1P8PBEjfFUb7EeHNBUa92vNHnJmvzUmhxb',
+        source = SOURCE,
         fee = 4000000,
         counter = 14,
         gas_limit = 1,
         storage_limit = 6,
-        message = [
-            bytes.fromhex('6d65737361676530'),
-            bytes.fromhex('6d65737361676531'),
-            bytes.fromhex('6d65737361676532'),
-            bytes.fromhex('6d65737361676533'),
-            bytes.fromhex('6d65737361676534'),
-            bytes.fromhex('6d65737361676535'),
-            bytes.fromhex('6d65737361676536'),
-            bytes.fromhex('6d65737361676537'),
-            bytes.fromhex('6d65737361676538'),
-            bytes.fromhex('6d65737361676539'),
-            bytes.fromhex('6d6573736167653130'),
-            bytes.fromhex('6d6573736167653131'),
-            bytes.fromhex('6d6573736167653132'),
-            bytes.fromhex('6d6573736167653133'),
-            bytes.fromhex('6d6573736167653134'),
-            bytes.fromhex('6d6573736167653135'),
-            bytes.fromhex('6d6573736167653136'),
-            bytes.fromhex('6d6573736167653137'),
-            bytes.fromhex('6d6573736167653138'),
-            bytes.fromhex('6d6573736167653139')
-        ]
+        message = list(ROLLUP_MESSAGES[:20])
     ),
     SetDepositLimit(
-        source = 'mv1P8PBEjfFUb7EeHNBUa92vNHnJmvzUmhxb',
+        source = SOURCE,
         fee = 1000000,
         counter = 15,
         gas_limit = 1,
@@ -109,6 +94,24 @@ BASIC_OPERATION = OperationGroup([
     )
 ])
 
+def navigate_too_long_warning(
+        firmware: Firmware,
+        mavryk_navigator: MavrykNavigator,
+        snapshot_dir: Path,
+        accept: bool
+):
+    """Go through the blindsign warning of a too long operation."""
+    if firmware.is_nano:
+        snap_path = snapshot_dir / "clear_n_too_long_warning"
+    else:
+        mavryk_navigator.skip_sign(snap_path=snapshot_dir / "skip")
+        snap_path = snapshot_dir / "blindsign_warning"
+
+    if accept:
+        mavryk_navigator.accept_sign_blindsign_risk(snap_path=snap_path)
+    else:
+        mavryk_navigator.refuse_sign_blindsign_risk(snap_path=snap_path)
+
 def test_sign_basic_too_long_operation(
         backend: MavrykBackend,
         firmware: Firmware,
@@ -124,11 +127,7 @@ def test_sign_basic_too_long_operation(
     mavryk_navigator.toggle_blindsign()
 
     with backend.sign(account, message, with_hash=True) as result:
-        if firmware.is_nano:
-            mavryk_navigator.accept_sign_blindsign_risk(snap_path=snapshot_dir / "clear_n_too_long_warning")
-        else:
-            mavryk_navigator.skip_sign(snap_path=snapshot_dir / "skip")
-            mavryk_navigator.accept_sign_blindsign_risk(snap_path=snapshot_dir / "blindsign_warning")
+        navigate_too_long_warning(firmware, mavryk_navigator, snapshot_dir, accept=True)
         mavryk_navigator.accept_sign(snap_path=snapshot_dir / "summary")
 
     account.check_signature(
@@ -151,11 +150,7 @@ def test_reject_basic_too_long_operation_at_warning(
 
     with StatusCode.REJECT.expected():
         with backend.sign(account, BASIC_OPERATION):
-            if firmware.is_nano:
-                mavryk_navigator.refuse_sign_blindsign_risk(snap_path=snapshot_dir / "clear_n_too_long_warning")
-            else:
-                mavryk_navigator.skip_sign(snap_path=snapshot_dir / "skip")
-                mavryk_navigator.refuse_sign_blindsign_risk(snap_path=snapshot_dir / "blindsign_warning")
+            navigate_too_long_warning(firmware, mavryk_navigator, snapshot_dir, accept=False)
 
 def test_reject_basic_too_long_operation_at_summary(
         backend: MavrykBackend,
@@ -171,11 +166,7 @@ def test_reject_basic_too_long_operation_at_summary(
 
     with StatusCode.REJECT.expected():
         with backend.sign(account, BASIC_OPERATION):
-            if firmware.is_nano:
-                mavryk_navigator.accept_sign_blindsign_risk(snap_path=snapshot_dir / "clear_n_too_long_warning")
-            else:
-                mavryk_navigator.skip_sign(snap_path=snapshot_dir / "skip")
-                mavryk_navigator.accept_sign_blindsign_risk(snap_path=snapshot_dir / "blindsign_warning")
+            navigate_too_long_warning(firmware, mavryk_navigator, snapshot_dir, accept=True)
             mavryk_navigator.reject_sign(snap_path=snapshot_dir / "summary")
 
 @pytest.mark.use_on_device("touch")
@@ -211,72 +202,33 @@ def test_sign_too_long_operation_with_only_transactions(
         snapshot_dir: Path
 ):
     """Check sign too long operation that contains only transaction"""
+    destinations = (
+        'mv1GQ3j1iCWq1qw3YMhg6bMUTwH9Rdp3SE8e',
+        'mv2M8TeVU9NCfkdzzdxZJhZmTiuMiFoTu3rs',
+        'mv1BffkEZbfk39B41da8eZCBBebKZPWugUDX',
+        'mv3EkfVEWmznKKUhWzUApYJXonS2BxawQBKY',
+        'mv3CvMoFaDEmMA6mufFv7TmxvdtVLkneSngc',
+        'mv2X4QWis6hXdqvo75GLK7r8CHLcUgVrQH85'
+    )
+    amounts = (10000000, 1000000, 2000000, 3000000, 4000000, 5000000)
     message = OperationGroup([
         Transaction(
-            source = 'mv1P8PBEjfFUb7EeHNBUa92vNHnJmvzUmhxb',
-            fee = 0,
-            counter = 11,
-            gas_limit = 1,
-            storage_limit = 0,
-            destination = 'mv1GQ3j1iCWq1qw3YMhg6bMUTwH9Rdp3SE8e',
-            amount = 10000000
-        ),
-        Transaction(
-            source = 'mv1P8PBEjfFUb7EeHNBUa92vNHnJmvzUmhxb',
-            fee = 1000000,
-            counter = 12,
+            source = SOURCE,
+            fee = i * 1000000,
+            counter = 11 + i,
             gas_limit = 1,
-            storage_limit = 1,
-            destination = 'mv2M8TeVU9NCfkdzzdxZJhZmTiuMiFoTu3rs',
-            amount = 1000000
-        ),
-        Transaction(
-            source = 'mv1P8PBEjfFUb7EeHNBUa92vNHnJmvzUmhxb',
-            fee = 2000000,
-            counter = 13,
-            gas_limit = 1,
-            storage_limit = 2,
-            destination = 'mv1BffkEZbfk39B41da8eZCBBebKZPWugUDX',
-            amount = 2000000
-        ),
-        Transaction(
-            source = 'mv1P8PBEjfFUb7EeHNBUa92vNHnJmvzUmhxb',
-            fee = 3000000,
-            counter = 14,
-            gas_limit = 1,
-            storage_limit = 3,
-            destination = 'mv3EkfVEWmznKKUhWzUApYJXonS2BxawQBKY',
-            amount = 3000000
-        ),
-        Transaction(
-            source = 'mv1P8PBEjfFUb7EeHNBUa92vNHnJmvzUmhxb',
-            fee = 4000000,
-            counter = 15,
-            gas_limit = 1,
-            storage_limit = 4,
-            destination = 'mv3CvMoFaDEmMA6mufFv7TmxvdtVLkneSngc',
-            amount = 4000000
-        ),
-        Transaction(
-            source = 'mv1P8PBEjfFUb7EeHNBUa92vNHnJmvzUmhxb',
-            fee = 5000000,
-            counter = 16,
-            gas_limit = 1,
-            storage_limit = 5,
-            destination = 'mv2X4QWis6hXdqvo75GLK7r8CHLcUgVrQH85',
-            amount = 5000000
+            storage_limit = i,
+            destination = destination,
+            amount = amount
         )
+        for i, (destination, amount) in enumerate(zip(destinations, amounts))
     ])
 
     mavryk_navigator.toggle_expert_mode()
     mavryk_navigator.toggle_blindsign()
 
     with backend.sign(account, message, with_hash=True) as result:
-        if firmware.is_nano:
-            mavryk_navigator.accept_sign_blindsign_risk(snap_path=snapshot_dir / "clear_n_too_long_warning")
-        else:
-            mavryk_navigator.skip_sign(snap_path=snapshot_dir / "skip")
-            mavryk_navigator.accept_sign_blindsign_risk(snap_path=snapshot_dir / "blindsign_warning")
+        navigate_too_long_warning(firmware, mavryk_navigator, snapshot_dir, accept=True)
         mavryk_navigator.accept_sign(snap_path=snapshot_dir / "summary")
 
     account.check_signature(
@@ -295,7 +247,7 @@ def test_sign_too_long_operation_without_fee_or_amount(
 ):
     """Check sign too long operation that doesn't have fees or amount"""
     message = Proposals(
-        source = 'mv1P8PBEjfFUb7EeHNBUa92vNHnJmvzUmhxb',
+        source = SOURCE,
         proposals = [
             'ProtoDemoNoopsDemoNoopsDemoNoopsDemoNoopsDemo6XBoYp',
             'ProtoGenesisGenesisGenesisGenesisGenesisGenesk612im',
@@ -310,11 +262,7 @@ def test_sign_too_long_operation_without_fee_or_amount(
     mavryk_navigator.toggle_blindsign()
 
     with backend.sign(account, message, with_hash=True) as result:
-        if firmware.is_nano:
-            mavryk_navigator.accept_sign_blindsign_risk(snap_path=snapshot_dir / "clear_n_too_long_warning")
-        else:
-            mavryk_navigator.skip_sign(snap_path=snapshot_dir / "skip")
-            mavryk_navigator.accept_sign_blindsign_risk(snap_path=snapshot_dir / "blindsign_warning")
+        navigate_too_long_warning(firmware, mavryk_navigator, snapshot_dir, accept=True)
         mavryk_navigator.accept_sign(snap_path=snapshot_dir / "summary")
 
     account.check_signature(
@@ -328,46 +276,15 @@ def test_sign_too_long_operation_without_fee_or_amount(
 
 OPERATION_WITH_TOO_LARGE = OperationGroup([
     ScRollupAddMessage(
-        source = 'mv1P8PBEjfFUb7EeHNBUa92vNHnJmvzUmhxb',
+        source = SOURCE,
         fee = 4000000,
         counter = 11,
         gas_limit = 1,
         storage_limit = 6,
-        message = [
-            bytes.fromhex('6d65737361676530'),
-            bytes.fromhex('6d65737361676531'),
-            bytes.fromhex('6d65737361676532'),
-            bytes.fromhex('6d65737361676533'),
-            bytes.fromhex('6d65737361676534'),
-            bytes.fromhex('6d65737361676535'),
-            bytes.fromhex('6d65737361676536'),
-            bytes.fromhex('6d65737361676537'),
-            bytes.fromhex('6d65737361676538'),
-            bytes.fromhex('6d65737361676539'),
-            bytes.fromhex('6d6573736167653130'),
-            bytes.fromhex('6d6573736167653131'),
-            bytes.fromhex('6d6573736167653132'),
-            bytes.fromhex('6d6573736167653133'),
-            bytes.fromhex('6d6573736167653134'),
-            bytes.fromhex('6d6573736167653135'),
-            bytes.fromhex('6d6573736167653136'),
-            bytes.fromhex('6d6573736167653137'),
-            bytes.fromhex('6d6573736167653138'),
-            bytes.fromhex('6d6573736167653139'),
-            bytes.fromhex('6d6573736167653230'),
-            bytes.fromhex('6d6573736167653231'),
-            bytes.fromhex('6d6573736167653232'),
-            bytes.fromhex('6d6573736167653233'),
-            bytes.fromhex('6d6573736167653234'),
-            bytes.fromhex('6d6573736167653235'),
-            bytes.fromhex('6d6573736167653236'),
-            bytes.fromhex('6d6573736167653237'),
-            bytes.fromhex('6d6573736167653238'),
-            bytes.fromhex('6d6573736167653239')
-        ]
+        message = list(ROLLUP_MESSAGES[:30])
     ),
     RegisterGlobalConstant(
-        source = 'mv1P8PBEjfFUb7EeHNBUa92vNHnJmvzUmhxb',
+        source = SOURCE,
         fee = 5000000,
         counter = 12,
         gas_limit = 1,
@@ -470,6 +387,24 @@ def test_reject_too_long_operation_with_too_large_at_blindsigning_warning(
             mavryk_navigator.accept_sign_error_risk(snap_path=snapshot_dir / "too_large_warning")
             mavryk_navigator.refuse_sign_blindsign_risk(snap_path=snapshot_dir / "blindsigning_warning")
 
+def nested_sequence(leaf: Micheline, depth: int) -> Micheline:
+    """Build a Micheline expression made of `leaf` nested in `depth` sequences."""
+    expr = leaf
+    for _ in range(depth):
+        expr = [expr]
+    return expr
+
+TOO_DEEP_NANOS_INSTRUCTIONS: Tuple[Union[NavIns, NavInsID], ...] = (
+    # 'Review operation'
+    NavInsID.RIGHT_CLICK,  # 'Expression {{{...{{{'
+    NavInsID.RIGHT_CLICK,  # 'Expression {{{...{{{'
+    NavInsID.RIGHT_CLICK,  # 'The transaction cannot be trusted.'
+    NavInsID.RIGHT_CLICK,  # 'Parsing error ERR_TOO_DEEP'
+    NavInsID.RIGHT_CLICK,  # 'Learn More: bit.ly/ledger-tez'
+    NavInsID.RIGHT_CLICK,  # 'Accept risk'
+    NavInsID.BOTH_CLICK,
+)
+
 def test_blindsign_too_deep(
         backend: MavrykBackend,
         firmware: Firmware,
@@ -478,25 +413,13 @@ def test_blindsign_too_deep(
         snapshot_dir: Path):
     """Check blindsigning on too deep expression"""
 
-    expression = MichelineExpr([[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[{'int':42}]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]])
+    expression = MichelineExpr(nested_sequence({'int':42}, depth=50))
 
     with backend.sign(account, expression, with_hash=True) as result:
         if firmware == Firmware.NANOS:
             ### Simulate `navigate_review` up to `ACCEPT_RISK` because the nanos screen can look like it hasn't changed.
-
-            instructions: List[Union[NavIns, NavInsID]] = [
-                # 'Review operation'
-                NavInsID.RIGHT_CLICK,  # 'Expression {{{...{{{'
-                NavInsID.RIGHT_CLICK,  # 'Expression {{{...{{{'
-                NavInsID.RIGHT_CLICK,  # 'The transaction cannot be trusted.'
-                NavInsID.RIGHT_CLICK,  # 'Parsing error ERR_TOO_DEEP'
-                NavInsID.RIGHT_CLICK,  # 'Learn More: bit.ly/ledger-tez'
-                NavInsID.RIGHT_CLICK,  # 'Accept risk'
-                NavInsID.BOTH_CLICK,
-            ]
-
             mavryk_navigator.unsafe_navigate(
-                instructions=instructions,
+                instructions=TOO_DEEP_NANOS_INSTRUCTIONS,
                 screen_change_before_first_instruction=True,
                 screen_change_after_last_instruction=False,
                 snap_path=snapshot_dir / "clear",
@@ -514,6 +437,8 @@ def test_blindsign_too_deep(
         data=result.value
     )
 
+TOO_LARGE_EXPRESSION = MichelineExpr({'int':12345678901234567890123456789012345678901234567890123456789012345678901234567890})
+
 def test_blindsign_too_large(
         backend: MavrykBackend,
         firmware: Firmware,
@@ -523,7 +448,7 @@ def test_blindsign_too_large(
 ):
     """Check blindsigning on too large expression"""
 
-    message = MichelineExpr({'int':12345678901234567890123456789012345678901234567890123456789012345678901234567890})
+    message = TOO_LARGE_EXPRESSION
 
     with backend.sign(account, message, with_hash=True) as result:
         mavryk_navigator.accept_sign_error_risk(snap_path=snapshot_dir / "clear")
@@ -545,7 +470,7 @@ def test_blindsign_reject_from_clear(
 ):
     """Check blindsigning rejection"""
 
-    expression = MichelineExpr({'int':12345678901234567890123456789012345678901234567890123456789012345678901234567890})
+    expression = TOO_LARGE_EXPRESSION
 
     with StatusCode.PARSE_ERROR.expected():
         with backend.sign(account, expression):
@@ -560,7 +485,7 @@ def test_blindsign_reject_from_blind(
 ):
     """Check blindsigning rejection"""
 
-    expression = MichelineExpr({'int':12345678901234567890123456789012345678901234567890123456789012345678901234567890})
+    expression = TOO_LARGE_EXPRESSION
 
     if firmware.is_nano:
         error = StatusCode.REJECT
@@ -574,6 +499,13 @@ def test_blindsign_reject_from_blind(
                 mavryk_navigator.accept_sign_blindsign_risk(snap_path=snapshot_dir / "blind_warning")
             mavryk_navigator.reject_sign(snap_path=snapshot_dir / "blind")
 
+def right_pair(items: List[Micheline]) -> Micheline:
+    """Build the right comb of pairs of `items` ending with an empty sequence."""
+    expr: Micheline = []
+    for item in reversed(items):
+        expr = {'prim': 'pair', 'args': [item, expr]}
+    return expr
+
 def test_ensure_always_clearsign(
         backend: MavrykBackend,
         firmware: Firmware,
@@ -588,7 +520,7 @@ def test_ensure_always_clearsign(
         mavryk_navigator.toggle_blindsign()
 
     message = Transaction(
-        source = 'mv1P8PBEjfFUb7EeHNBUa92vNHnJmvzUmhxb',
+        source = SOURCE,
         fee = 10000,
         counter = 2,
         gas_limit = 3,
@@ -596,7 +528,10 @@ def test_ensure_always_clearsign(
         destination = 'KT18amZmM5W7qDWVt2pH6uj7sCEd3kbzLrHT',
         amount = 0,
         entrypoint = 'root',
-        parameter = [{'prim':'pair','args':[{'string':"["},{'prim':'pair','args':[{'string':"Z"},{'prim':'pair','args':[{'string':"Y"},{'prim':'pair','args':[{'string':"X"},{'prim':'pair','args':[{'string':"W"},{'prim':'pair','args':[{'string':"V"},{'prim':'pair','args':[{'string':"U"},{'prim':'pair','args':[{'string':"T"},{'prim':'pair','args':[{'string':"S"},{'prim':'pair','args':[{'string':"R"},{'prim':'pair','args':[{'string':"Q"},{'prim':'pair','args':[{'string':"P"},{'prim':'pair','args':[{'string':"O"},{'prim':'pair','args':[{'string':"N"},{'prim':'pair','args':[{'string':"M"},{'prim':'pair','args':[{'string':"L"},{'prim':'pair','args':[{'string':"K"},{'prim':'pair','args':[{'string':"J"},{'prim':'pair','args':[{'string':"I"},{'prim':'pair','args':[{'string':"H"},{'prim':'pair','args':[{'string':"G"},{'prim':'pair','args':[{'string':"F"},{'prim':'pair','args':[{'string':"E"},{'prim':'pair','args':[{'string':"D"},{'prim':'pair','args':[{'string':"C"},{'prim':'pair','args':[{'string':"B"},[]]}]}]}]}]}]}]}]}]}]}]}]}]}]}]}]}]}]}]}]}]}]}]}]}]}]},{'prim':'pair','args':[{'int':10},{'prim':'pair','args':[{'int':9},{'prim':'pair','args':[{'int':8},{'prim':'pair','args':[{'int':7},{'prim':'pair','args':[{'int':6},{'prim':'pair','args':[{'int':5},{'prim':'pair','args':[{'int':4},{'prim':'pair','args':[{'int':3},{'prim':'pair','args':[{'int':2},{'prim':'pair','args':[{'int':1},[]]}]}]}]}]}]}]}]}]}]}]
+        parameter = [
+            right_pair([{'string': c} for c in "[ZYXWVUTSRQPONMLKJIHGFEDCB"]),
+            right_pair([{'int': i} for i in range(10, 0, -1)])
+        ]
     )
 
     with backend.sign(account, message, with_hash=True) as result:
@@ -18,54 +18,47 @@
 
 import pytest
 
-from utils.account import Account, SigType
+from utils.account import Account, CURVE_ACCOUNTS, DEFAULT_PATH, SigType
 from utils.backend import MavrykBackend
 from utils.message import MichelineExpr
 from utils.navigator import MavrykNavigator
 
 
-@pytest.mark.parametrize(
-    "account", [
-        Account("m/44'/1969'/0'/0'",
-                SigType.ED25519,
-                "edpktmumZ4vUDvg7VNFh5sGeSCnT7xYXhmzP2jwsiUUpUnQGoGfnja"),
-        Account("m/44'/1969'/0'/0'",
-                SigType.SECP256K1,
-                "sppk7b2Sh8Av9e1w7jzQ4qjZEgULFJETncKh7nWkgf29JpnJuKeXBqK"),
-        Account("m/44'/1969'/0'/0'",
-                SigType.SECP256R1,
-                "p2pk65YHEfEbWo7iMrz7JNjBvaYZNFBHU8vzCQEhw8rmbvAKuiGGiXS"),
-        Account("m/44'/1969'/0'/0'",
-                SigType.BIP32_ED25519,
-                "edpkuPErh5Lga9Ui39JPgfCHq2utQjGtKb3ig5NwM8yFnaetY1xD9f"),
-    ],
-    ids=lambda account: f"{account.sig_type}"
-)
+# Forged once for all signatures
+MESSAGE = MichelineExpr([{'int': 0}])
+
+
 def test_sign_with_another_sig(
         backend: MavrykBackend,
-        mavryk_navigator: MavrykNavigator,
-        account: Account
+        mavryk_navigator: MavrykNavigator
 ):
-    """Check signing with ed25519"""
+    """Check signing with every signature type"""
 
-    message = MichelineExpr([{'int': 0}])
+    # All signature types are signed on the same app instance first,
+    # then verified on the host, `check_signature` reports the failing
+    # account.
+    signatures = []
+    for account in CURVE_ACCOUNTS:
+        with backend.sign(account, MESSAGE, with_hash=True) as result:
+            mavryk_navigator.accept_sign()
+        signatures.append((account, result.value))
 
-    with backend.sign(account, message, with_hash=True) as result:
-        mavryk_navigator.accept_sign()
+    for account, data in signatures:
+        account.check_signature(
+            message=MESSAGE,
+            with_hash=True,
+            data=data
+        )
 
-    account.check_signature(
-        message=message,
-        with_hash=True,
-        data=result.value
-    )
 
+SEED21 = "around dignity equal spread between young lawsuit interest climb wide that panther rather mom snake scene ecology reunion ice illegal brush"
+
+# Default account of the `seed21` seed
+SEED21_ACCOUNT = Account(DEFAULT_PATH,
+                         SigType.ED25519,
+                         "edpkvNxv85WuxHmmbTPARYXzjKhy6Q2UeX6x7JXXg5QBEhUR2Wk1Je")
 
-@pytest.mark.parametrize(
-    "seed", [
-        "around dignity equal spread between young lawsuit interest climb wide that panther rather mom snake scene ecology reunion ice illegal brush"
-    ],
-    ids=["seed21"]
-)
+@pytest.mark.parametrize("seed", [SEED21], ids=["seed21"])
 def test_sign_with_another_seed(
         backend: MavrykBackend,
         mavryk_navigator: MavrykNavigator
@@ -74,17 +67,11 @@ def test_sign_with_another_seed(
 
     mavryk_navigator.toggle_expert_mode()
 
-    account = Account("m/44'/1969'/0'/0'",
-                      SigType.ED25519,
-                      "edpkvNxv85WuxHmmbTPARYXzjKhy6Q2UeX6x7JXXg5QBEhUR2Wk1Je")
-
-    message = MichelineExpr([{'int': 0}])
-
-    with backend.sign(account, message, with_hash=True) as result:
+    with backend.sign(SEED21_ACCOUNT, MESSAGE, with_hash=True) as result:
         mavryk_navigator.accept_sign()
 
-    account.check_signature(
-        message=message,
+    SEED21_ACCOUNT.check_signature(
+        message=MESSAGE,
         with_hash=True,
         data=result.value
     )
@@ -15,7 +15,8 @@
 """Module providing an account interface."""
 
 from enum import IntEnum
-from typing import Union
+from functools import cached_property, lru_cache
+from typing import Callable, Dict, Tuple, Union
 
 from pymavryk import pymavryk
 from pymavryk.crypto.encoding import base58_encode
@@ -80,18 +81,18 @@ class Signature(bytes):
     @classmethod
     def from_bytes(cls, data: bytes, sig_type: SigType) -> 'Signature':
         """Get the signature according to the SigType."""
-        if sig_type in {SigType.ED25519, SigType.BIP32_ED25519}:
-            prefix = b'edsig'
-        elif sig_type == SigType.SECP256K1:
-            prefix = b'spsig'
-            data = Signature.from_secp256_tlv(data)
-        elif sig_type == SigType.SECP256R1:
-            prefix = b'p2sig'
-            data = Signature.from_secp256_tlv(data)
-        else:
-            assert False, f"Wrong signature type: {sig_type}"
+        decoder = SIGNATURE_DECODERS.get(sig_type)
+        assert decoder is not None, f"Wrong signature type: {sig_type}"
+        convert, prefix = decoder
+        return cls(base58_encode(convert(data), prefix))
 
-        return cls(base58_encode(data, prefix))
+
+SIGNATURE_DECODERS: Dict[int, Tuple[Callable[[bytes], bytes], bytes]] = {
+    SigType.ED25519:       (bytes, b'edsig'),
+    SigType.SECP256K1:     (Signature.from_secp256_tlv, b'spsig'),
+    SigType.SECP256R1:     (Signature.from_secp256_tlv, b'p2sig'),
+    SigType.BIP32_ED25519: (bytes, b'edsig'),
+}
 
 
 class PublicKey(bytes):
@@ -109,6 +110,27 @@ class PublicKey(bytes):
         def __bytes__(self) -> bytes:
             return bytes([self])
 
+    @classmethod
+    def _from_ed25519(cls, kind: int, data: bytes, prefix: bytes) -> 'PublicKey':
+        """Convert a Ed25519 public key from bytes to string"""
+        assert kind == cls.CompressionKind.EVEN, \
+            f"Wrong Ed25519 public key compression kind: {kind}"
+        assert len(data) == 32, \
+            f"Wrong Ed25519 public key length: {len(data)}"
+        return cls(base58_encode(data, prefix))
+
+    @classmethod
+    def _from_secp256(cls, kind: int, data: bytes, prefix: bytes) -> 'PublicKey':
+        """Convert a Secp256 public key from bytes to string"""
+        assert kind == cls.CompressionKind.UNCOMPRESSED, \
+            f"Wrong Secp256 public key compression kind: {kind}"
+        assert len(data) == 2 * 32, \
+            f"Wrong Secp256 public key length: {len(data)}"
+        kind = cls.CompressionKind.ODD if data[-1] & 1 else \
+            cls.CompressionKind.EVEN
+        data = bytes(kind) + data[:32]
+        return cls(base58_encode(data, prefix))
+
     @classmethod
     def from_bytes(cls, data: bytes, sig_type: Union[SigType, int]) -> 'PublicKey':
         """Convert a public key from bytes to string"""
@@ -122,34 +144,25 @@ class PublicKey(bytes):
         kind = data[0]
         data = data[1:]
 
-        # Ed25519
-        if sig_type in [
-                SigType.ED25519,
-                SigType.BIP32_ED25519
-        ]:
-            assert kind == cls.CompressionKind.EVEN, \
-                f"Wrong Ed25519 public key compression kind: {kind}"
-            assert len(data) == 32, \
-                f"Wrong Ed25519 public key length: {len(data)}"
-            return cls(base58_encode(data, b'edpk'))
-
-        # Secp256
-        if sig_type in [
-                SigType.SECP256K1,
-                SigType.SECP256R1
-        ]:
-            assert kind == cls.CompressionKind.UNCOMPRESSED, \
-                f"Wrong Secp256 public key compression kind: {kind}"
-            assert len(data) == 2 * 32, \
-                f"Wrong Secp256 public key length: {len(data)}"
-            kind = cls.CompressionKind.ODD if data[-1] & 1 else \
-                cls.CompressionKind.EVEN
-            prefix = b'sppk' if sig_type == SigType.SECP256K1 \
-                else b'p2pk'
-            data = bytes(kind) + data[:32]
-            return cls(base58_encode(data, prefix))
-
-        assert False, f"Wrong signature type: {sig_type}"
+        decoder = PUBLIC_KEY_DECODERS.get(sig_type)
+        assert decoder is not None, f"Wrong signature type: {sig_type}"
+        convert, prefix = decoder
+        return convert(kind, data, prefix)
+
+
+PUBLIC_KEY_DECODERS: Dict[int, Tuple[Callable[[int, bytes, bytes], PublicKey], bytes]] = {
+    SigType.ED25519:       (PublicKey._from_ed25519, b'edpk'),
+    SigType.SECP256K1:     (PublicKey._from_secp256, b'sppk'),
+    SigType.SECP256R1:     (PublicKey._from_secp256, b'p2pk'),
+    SigType.BIP32_ED25519: (PublicKey._from_ed25519, b'edpk'),
+}
+
+
+@lru_cache(maxsize=None)
+def pack_path(path: str) -> bytes:
+    """Pack a derivation path.
+    Memoized as accounts mostly share the same path."""
+    return pack_derivation_path(path)
 
 
 class Account:
@@ -164,7 +177,7 @@ class Account:
                  sig_type: Union[SigType, int],
                  key: str):
         self.path = \
-            pack_derivation_path(path) if isinstance(path, str) \
+            pack_path(path) if isinstance(path, str) \
             else path
         self.sig_type = sig_type
         self.__key = key
@@ -172,11 +185,16 @@ class Account:
     def __repr__(self) -> str:
         return self.__key
 
-    @property
+    @cached_property
     def key(self) -> PymavrykKey:
         """pymavryk key of the account."""
         return pymavryk.using(key=self.__key).key
 
+    @cached_property
+    def public_key(self) -> PublicKey:
+        """Encoded public key of the account."""
+        return PublicKey(self.key.public_key().encode())
+
     def check_signature(
             self,
             data: bytes,
@@ -190,7 +208,7 @@ class Account:
 
         signature = Signature.from_bytes(data, SigType(self.sig_type))
 
-        assert self.key.verify(signature, bytes(message)), \
+        assert self.key.verify(signature, message.forged), \
             f"Fail to verify signature {signature!r}, \n\
             with account {self} \n\
             and message {message}"
@@ -198,8 +216,25 @@ class Account:
 
 DEFAULT_SEED = ' '.join(['zebra']*24)
 
+DEFAULT_PATH = "m/44'/1969'/0'/0'"
+
 DEFAULT_ACCOUNT = Account(
-    "m/44'/1969'/0'/0'",
+    DEFAULT_PATH,
     SigType.ED25519,
     "edpktmumZ4vUDvg7VNFh5sGeSCnT7xYXhmzP2jwsiUUpUnQGoGfnja"
 )
+
+# One account per signature type, shared by all tests so that each key
+# is parsed once per session
+CURVE_ACCOUNTS = (
+    DEFAULT_ACCOUNT,
+    Account(DEFAULT_PATH,
+            SigType.SECP256K1,
+            "sppk7b2Sh8Av9e1w7jzQ4qjZEgULFJETncKh7nWkgf29JpnJuKeXBqK"),
+    Account(DEFAULT_PATH,
+            SigType.SECP256R1,
+            "p2pk65YHEfEbWo7iMrz7JNjBvaYZNFBHU8vzCQEhw8rmbvAKuiGGiXS"),
+    Account(DEFAULT_PATH,
+            SigType.BIP32_ED25519,
+            "edpkuPErh5Lga9Ui39JPgfCHq2utQjGtKb3ig5NwM8yFnaetY1xD9f")
+)
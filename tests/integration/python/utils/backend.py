@@ -14,10 +14,11 @@
 
 """Mavryk app backend."""
 
+from concurrent.futures import Future
 from contextlib import contextmanager
 from enum import IntEnum
-from multiprocessing.pool import ThreadPool
 from struct import unpack
+from threading import Thread
 import time
 from typing import Callable, Generator, TypeVar, Union
 
@@ -165,20 +166,22 @@ RESPONSE = TypeVar('RESPONSE')
 def async_thread(function: Callable[..., RESPONSE]):
     """Decorator that runs asynchronously the function and provides a
     context manager to access the result in a `value` field"""
+    # A single daemon thread per call: a `ThreadPool` would also start
+    # its task, result and worker handler threads each time
     @contextmanager
     def wrapper(*args, **kwargs) -> Generator[SimpleNamespace, None, None]:
         thread_result = SimpleNamespace(value=None)
-        thread_pool = ThreadPool(processes=1)
-        try:
-            thread_async_result = thread_pool.apply_async(
-                function,
-                args=args,
-                kwds=kwargs
-            )
-            yield thread_result
-            thread_result.value = thread_async_result.get()
-        finally:
-            thread_pool.terminate()
+        future: Future = Future()
+
+        def run() -> None:
+            try:
+                future.set_result(function(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+        Thread(target=run, daemon=True).start()
+        yield thread_result
+        thread_result.value = future.result()
     return wrapper
 
 
@@ -260,7 +263,8 @@ class MavrykBackend(BackendInterface):
              with_hash: bool = False,
              apdu_size: int = MAX_APDU_SIZE) -> bytes:
         """Requests the signature of a message."""
-        msg = bytes(message)
+        # Slicing a memoryview does not copy the remaining message
+        msg = memoryview(message.forged)
         assert msg, "Do not sign empty message"
 
         ins = Ins.SIGN_WITH_HASH if with_hash else Ins.SIGN
@@ -268,7 +272,7 @@ class MavrykBackend(BackendInterface):
         self._ask_sign(ins, account)
 
         while msg:
-            payload = msg[:apdu_size]
+            payload = bytes(msg[:apdu_size])
             msg     = msg[apdu_size:]
             last    = not msg
             data    = self._continue_sign(ins, payload, last)
@@ -16,7 +16,8 @@
 
 from abc import ABC, abstractmethod
 from enum import IntEnum
-from typing import Any, Dict, List, Optional, Union
+from functools import cached_property, lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from pymavryk.block.forge import forge_int_fixed
 from pymavryk.crypto.key import blake2b_32
@@ -38,17 +39,24 @@ from pymavryk.rpc.kind import operation_tags
 class Message(ABC):
     """Class representing a message."""
 
-    @property
+    @cached_property
+    def forged(self) -> bytes:
+        """bytes of the message.
+        Forged once, a message must not be modified after being used."""
+        return bytes(self)
+
+    @cached_property
     def hash(self) -> bytes:
-        """hash of the message."""
-        return blake2b_32(bytes(self)).digest()
+        """hash of the message.
+        Computed once, like `forged`."""
+        return blake2b_32(self.forged).digest()
 
     @abstractmethod
     def __bytes__(self) -> bytes:
         raise NotImplementedError
 
     def __str__(self) -> str:
-        return bytes(self).hex()
+        return self.forged.hex()
 
 class RawMessage(Message):
     """Class representing a raw message."""
@@ -100,10 +108,10 @@ class MichelineExpr(Message):
         self.expr = expr
 
     def __bytes__(self) -> bytes:
-        raw = b''
-        raw += forge_int_fixed(Watermark.MICHELINE_EXPRESSION, 1)
-        raw += forge_micheline(self.expr)
-        return raw
+        return b''.join([
+            forge_int_fixed(Watermark.MICHELINE_EXPRESSION, 1),
+            forge_micheline(self.expr)
+        ])
 
 
 class OperationBuilder(ContentMixin):
@@ -189,7 +197,7 @@ class OperationBuilder(ContentMixin):
             pvm_kind: str = '',
             kernel: str = '',
             parameters_ty: Micheline = Default.DefaultMicheline.TYPE,
-            whitelist: Optional[List[str]] = None,
+            whitelist: Optional[Sequence[str]] = None,
             source: str = '',
             counter: int = 0,
             fee: int = 0,
@@ -213,6 +221,31 @@ class OperationBuilder(ContentMixin):
 
         return self.operation(content)
 
+@lru_cache(maxsize=None)
+def forge_implicit_address(pkh: str) -> bytes:
+    """Forge an implicit account address.
+    Memoized as tests keep forging the same few addresses."""
+    return forge_address(pkh, mv_only=True)
+
+@lru_cache(maxsize=None)
+def forge_any_address(address: str) -> bytes:
+    """Forge an implicit or originated address.
+    Memoized, see `forge_implicit_address`."""
+    return forge_address(address)
+
+@lru_cache(maxsize=None)
+def forge_hash(value: str) -> bytes:
+    """Forge a base58 encoded hash (block, protocol...).
+    Memoized, see `forge_implicit_address`."""
+    return forge_base58(value)
+
+@lru_cache(maxsize=None)
+def forge_whitelist(whitelist: Tuple[str, ...]) -> bytes:
+    """Forge a smart rollup whitelist.
+    All the addresses are forged in a single pass and the resulting
+    array is memoized for the whole whitelist."""
+    return forge_array(b''.join(map(forge_implicit_address, whitelist)))
+
 class OperationForge:
     """Class to helps forging Mavryk operation."""
 
@@ -242,9 +275,9 @@ class OperationForge:
     def proposals(content: Dict[str, Any]) -> bytes:
         """Forge a Mavryk proposals."""
         res = forge_tag(operation_tags[content['kind']])
-        res += forge_address(content['source'], mv_only=True)
+        res += forge_implicit_address(content['source'])
         res += forge_int32(int(content['period']))
-        res += forge_array(b''.join(map(forge_base58, content['proposals'])))
+        res += forge_array(b''.join(map(forge_hash, content['proposals'])))
         return res
 
     BALLOT_TAG = { 'yay': 0, 'nay': 1, 'pass': 2 }
@@ -253,9 +286,9 @@ class OperationForge:
     def ballot(content: Dict[str, Any]) -> bytes:
         """Forge a Mavryk ballot."""
         res = forge_tag(operation_tags[content['kind']])
-        res += forge_address(content['source'], mv_only=True)
+        res += forge_implicit_address(content['source'])
         res += forge_int32(int(content['period']))
-        res += forge_base58(content['proposal'])
+        res += forge_hash(content['proposal'])
         res += forge_int_fixed(OperationForge.BALLOT_TAG[content['ballot']], 1)
         return res
 
@@ -263,7 +296,7 @@ class OperationForge:
     def set_deposit_limit(content: Dict[str, Any]) -> bytes:
         """Forge a Mavryk set-deposit-limit."""
         res = forge_tag(operation_tags[content['kind']])
-        res += forge_address(content['source'], mv_only=True)
+        res += forge_implicit_address(content['source'])
         res += forge_nat(int(content['fee']))
         res += forge_nat(int(content['counter']))
         res += forge_nat(int(content['gas_limit']))
@@ -281,20 +314,20 @@ class OperationForge:
     def increase_paid_storage(content: Dict[str, Any]) -> bytes:
         """Forge a Mavryk increase-paid-storage."""
         res = forge_tag(operation_tags[content['kind']])
-        res += forge_address(content['source'], mv_only=True)
+        res += forge_implicit_address(content['source'])
         res += forge_nat(int(content['fee']))
         res += forge_nat(int(content['counter']))
         res += forge_nat(int(content['gas_limit']))
         res += forge_nat(int(content['storage_limit']))
         res += forge_nat(int(content['amount']))
-        res += forge_address(content['destination'])
+        res += forge_any_address(content['destination'])
         return res
 
     @staticmethod
     def update_consensus_key(content: Dict[str, Any]) -> bytes:
         """Forge a Mavryk update-consensus-key."""
         res = forge_tag(operation_tags[content['kind']])
-        res += forge_address(content['source'], mv_only=True)
+        res += forge_implicit_address(content['source'])
         res += forge_nat(int(content['fee']))
         res += forge_nat(int(content['counter']))
         res += forge_nat(int(content['gas_limit']))
@@ -308,7 +341,7 @@ class OperationForge:
     def smart_rollup_originate(content: Dict[str, Any]) -> bytes:
         """Forge a Mavryk smart rollup originate."""
         res = forge_tag(operation_tags[content['kind']])
-        res += forge_address(content['source'], mv_only=True)
+        res += forge_implicit_address(content['source'])
         res += forge_nat(int(content['fee']))
         res += forge_nat(int(content['counter']))
         res += forge_nat(int(content['gas_limit']))
@@ -321,10 +354,7 @@ class OperationForge:
 
         if content.get('whitelist') is not None:
             res += forge_bool(True)
-            res += forge_array(b''.join(
-                forge_address(pkh, mv_only=True)
-                for pkh in content['whitelist']
-            ))
+            res += forge_whitelist(tuple(content['whitelist']))
         else:
             res += forge_bool(False)
 
@@ -344,11 +374,11 @@ class Operation(Message, OperationBuilder):
         raise NotImplementedError
 
     def __bytes__(self) -> bytes:
-        raw = b''
-        raw += forge_int_fixed(Watermark.MANAGER_OPERATION, 1)
-        raw += forge_base58(self.branch)
-        raw += self.forge()
-        return raw
+        return b''.join([
+            forge_int_fixed(Watermark.MANAGER_OPERATION, 1),
+            forge_hash(self.branch),
+            self.forge()
+        ])
 
 class Proposals(Operation):
     """Class representing a mavryk proposals."""
@@ -716,13 +746,13 @@ class ScRollupOriginate(ManagerOperation):
     pvm_kind: str
     kernel: str
     parameters_ty: Micheline
-    whitelist: Optional[List[str]]
+    whitelist: Optional[Sequence[str]]
 
     def __init__(self,
                  pvm_kind: str = Default.SMART_ROLLUP_KIND,
                  kernel: str = "",
                  parameters_ty: Micheline = Default.DefaultMicheline.TYPE,
-                 whitelist: Optional[List[str]] = None,
+                 whitelist: Optional[Sequence[str]] = None,
                  **kwargs):
         self.pvm_kind = pvm_kind
         self.kernel = kernel
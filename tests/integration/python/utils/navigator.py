@@ -18,7 +18,7 @@
 from enum import auto
 from pathlib import Path
 import time
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 from ragger.backend import BackendInterface, SpeculosBackend
 from ragger.firmware import Firmware
@@ -327,7 +327,7 @@ class MavrykNavigator(metaclass=MetaScreen):
 
     def unsafe_navigate(
             self,
-            instructions: List[Union[NavIns, BaseNavInsID]],
+            instructions: Sequence[Union[NavIns, BaseNavInsID]],
             snap_path: Optional[Path] = None,
             timeout: float = 10.0,
             screen_change_before_first_instruction: bool = False,